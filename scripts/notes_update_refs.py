@@ -27,21 +27,33 @@ The script (re)generates everything between:
 """
 
 import argparse
-import glob
+import contextlib
+import functools
+import hashlib
+import itertools
 import os
+import pickle
 import re
 import shutil
-from datetime import datetime
-from typing import Optional, Tuple, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Optional, Tuple, Dict, Any, FrozenSet, Iterable, Iterator, List
 
 import yaml  # pip install pyyaml
-import bibtexparser  # pip install bibtexparser
+import bibtexparser  # pip install "bibtexparser>=2"
 
 BEGIN_MARK = "<!-- BEGIN:references -->"
 END_MARK = "<!-- END:references -->"
 
+# Prefer the libyaml-backed C loader/dumper when available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 HAS_STYLE_RE = re.compile(r"<style>.*?</style>", re.DOTALL | re.IGNORECASE)
 
+# The generation timestamp changes on every run; ignore it when comparing blocks
+GENERATED_DATE_RE = re.compile(r"^Generated bibliography markdown file\. Date: .*$", re.MULTILINE)
+
 DEFAULT_STYLE = """<style>
 p {
   font-family: sans;
@@ -59,11 +71,50 @@ ol > li::marker {
 }
 </style>
 """
+_DEFAULT_STYLE_STRIPPED = DEFAULT_STYLE.strip()
+
+_BRACES_RE = re.compile(r"[{}]")
+_WS_RE = re.compile(r"\s+")
+_DATE_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-")
+_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+
+# Below this many notes, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+# The only frontmatter keys process_file reads
+FAST_FRONTMATTER_KEYS = ("bibfile", "citekeys", "date")
+FAST_KEY_LINE_RE = re.compile(r"^([A-Za-z_][\w.-]*):(?:[ \t]+(.*))?$")
+FAST_PLAIN_BAD_START = "&*!|>[]{}%@`#,?:-<="
+FAST_NON_STR_RE = re.compile(
+    r"^(?:[-+.\d]|(?:y|Y|yes|Yes|YES|n|N|no|No|NO|true|True|TRUE|false|False|FALSE"
+    r"|on|On|ON|off|Off|OFF)$)"
+)
+
+# Give up on a header-only read if the closing '---' is not within this many chars
+FRONTMATTER_MAX_CHARS = 64 * 1024
+FRONTMATTER_READ_CHUNK = 4096
 
 # Cache loaded .bib files
 _BIB_CACHE: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
+# Parsed .bib files persisted across runs: one pickle per abspath, tagged
+# with (version, mtime, size) so an edited bib replaces its stale entry
+BIB_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "notes_update_refs")
+# Bump whenever the shape of a cached bib map changes (see _library_to_bib_map)
+BIB_DISK_CACHE_VERSION = 2
+
+# Cache partial .bib parses, keyed by (bib_path, citekeys)
+_BIB_SUBSET_CACHE: Dict[Tuple[str, FrozenSet[str]], Dict[str, Dict[str, Any]]] = {}
 
+# Bib maps built once in main() and handed to every worker, keyed by bib_path
+_PREBUILT_BIB_MAPS: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+# Rendered reference HTML, keyed by (citekey, id(entry)); the entry itself is
+# stored alongside so a recycled id() can never return a stale rendering
+_REF_HTML_CACHE: Dict[Tuple[str, int], Tuple[Dict[str, Any], Tuple[str, ...]]] = {}
+
+
+@functools.lru_cache(maxsize=4096)
 def clean_bibtex_braces(text: str) -> str:
     """Remove nested braces from BibTeX titles like {Two-{{Dimensional Turbulence}}}."""
     if not text:
@@ -71,7 +122,7 @@ def clean_bibtex_braces(text: str) -> str:
     cleaned = text.strip()
     if cleaned.startswith("{") and cleaned.endswith("}"):
         cleaned = cleaned[1:-1]
-    cleaned = re.sub(r"[{}]", "", cleaned)
+    cleaned = _BRACES_RE.sub("", cleaned)
     return cleaned.strip()
 
 
@@ -80,10 +131,10 @@ def _date_prefix_from_frontmatter(front_date) -> str:
     if not front_date:
         return ""
     try:
-        if hasattr(front_date, "strftime"):
-            return front_date.strftime("%Y-%m-%d") + "-"
+        if isinstance(front_date, date):  # also covers datetime
+            return front_date.isoformat()[:10] + "-"
         s = str(front_date).strip()
-        m = re.match(r"^(\d{4}-\d{2}-\d{2})", s)
+        m = _DATE_RE.match(s)
         if m:
             return m.group(1) + "-"
     except Exception:
@@ -91,33 +142,68 @@ def _date_prefix_from_frontmatter(front_date) -> str:
     return ""
 
 
-def make_backup(path: str, front_date=None) -> str:
+def make_backup(path: str, fm_prefix: str = "") -> str:
     """
     Create backup next to the note, named:
       folder/tmp-<slug>.bak
     where <slug> is the filename without extension and with a leading
-    'YYYY-MM-DD-' removed (preferably matching the frontmatter date).
+    'YYYY-MM-DD-' removed (preferably fm_prefix, the frontmatter date prefix
+    from _date_prefix_from_frontmatter).
+
+    The backup is a hard link where supported (no bytes copied), so the note
+    must afterwards be replaced (write_text_atomic), never rewritten in place.
     """
     folder = os.path.dirname(path)
     fname = os.path.basename(path)
     root, _ = os.path.splitext(fname)
 
-    fm_prefix = _date_prefix_from_frontmatter(front_date)
     if fm_prefix and root.startswith(fm_prefix):
         slug = root[len(fm_prefix):]
     else:
-        slug = re.sub(r"^\d{4}-\d{2}-\d{2}-", "", root)
+        slug = _DATE_PREFIX_RE.sub("", root)
 
     backup_name = f"tmp-{slug}.bak"
     backup_path = os.path.join(folder, backup_name)
-    shutil.copyfile(path, backup_path)
+    try:
+        os.remove(backup_path)
+    except FileNotFoundError:
+        pass
+    # Link the file a symlinked note points at, not the symlink itself
+    real_path = os.path.realpath(path)
+    try:
+        os.link(real_path, backup_path)
+    except (OSError, AttributeError):
+        shutil.copyfile(real_path, backup_path)
     return backup_path
 
 
+def write_text_atomic(path: str, text: str) -> None:
+    """
+    Write text to a temp file next to path, fsync it, then os.replace it onto path.
+    A symlinked path is resolved first, so the link keeps pointing at the new content.
+    """
+    path = os.path.realpath(path)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WS_RE.sub(" ", s or "").strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def format_authors(author_field: str) -> str:
     """Convert BibTeX 'author' to 'Last, F.' joined by ' and '."""
     if not author_field:
@@ -155,44 +241,52 @@ def safe_get(entry: dict, key: str) -> str:
     return (entry.get(key) or "").strip()
 
 
-def format_reference_html(key: str, entry: dict) -> str:
+def format_reference_html(key: str, entry: dict) -> Iterator[str]:
+    """Yield the HTML fragments of one reference line (no trailing newline)."""
     authors = format_authors(safe_get(entry, "author"))
     year = safe_get(entry, "year")
     raw_title = safe_get(entry, "title")
-    title = normalize_whitespace(clean_bibtex_braces(raw_title))
+    # str.split() splits on exactly the whitespace \s matches, without the regex
+    title = " ".join(clean_bibtex_braces(raw_title).split())
     journal = safe_get(entry, "journal")
     volume = safe_get(entry, "volume")
     number = safe_get(entry, "number")
     pages = safe_get(entry, "pages")
     link = entry_link(entry)
 
-    author_html = f'<span style="font-variant: small-caps"> {authors} </span>' if authors else ""
-
-    parts = []
     # Use ordered list via markdown "1." trick; add an anchorable <p id="...">
-    parts.append(f'1. <p id="{key}">')
-    if author_html:
-        parts.append(f" {author_html} ")
+    yield f'1. <p id="{key}">'
+    if authors:
+        yield f' <span style="font-variant: small-caps"> {authors} </span> '
     if year:
-        parts.append(f"{year} ")
+        yield f"{year} "
 
     if title:
         if link:
-            parts.append(f' <a href="{link}"> {title}. </a>')
+            yield f' <a href="{link}"> {title}. </a>'
         else:
-            parts.append(f" {title}. ")
+            yield f" {title}. "
 
     if journal:
-        parts.append(f" <i> {journal}</i>")
+        yield f" <i> {journal}</i>"
     if volume:
-        parts.append(f" <b> {volume} </b>")
+        yield f" <b> {volume} </b>"
     if number:
-        parts.append(f" ({number})")
+        yield f" ({number})"
     if pages:
-        parts.append(f" {pages}")
+        yield f" {pages}"
+
+    yield "</p>"
 
-    parts.append("</p>")
-    return "".join(parts)
+
+def _cached_reference_html(key: str, entry: dict) -> Tuple[str, ...]:
+    cache_key = (key, id(entry))
+    hit = _REF_HTML_CACHE.get(cache_key)
+    if hit is not None and hit[0] is entry:
+        return hit[1]
+    fragments = tuple(format_reference_html(key, entry))
+    _REF_HTML_CACHE[cache_key] = (entry, fragments)
+    return fragments
 
 
 def has_style_block(md_text: str) -> bool:
@@ -201,37 +295,50 @@ def has_style_block(md_text: str) -> bool:
 
 def generate_reference_block(keys, bib_map, add_style: bool = True) -> str:
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    lines = []
+    # Collect every fragment (separators included) and join once at the end
+    parts: List[str] = [BEGIN_MARK, "\n"]
     if add_style:
-        lines.append(DEFAULT_STYLE.strip())
-        lines.append("")
+        parts.extend((_DEFAULT_STYLE_STRIPPED, "\n\n"))
 
-    lines.append("# Reference")
-    lines.append(f"Generated bibliography markdown file. Date: {now}")
+    parts.extend(("# Reference\n", f"Generated bibliography markdown file. Date: {now}"))
 
-    missing = []
-    for k in keys:
-        entry = bib_map.get(k)
-        if not entry:
-            missing.append(k)
-            continue
-        lines.append(format_reference_html(k, entry))
-        lines.append("")
+    pairs = [(k, bib_map.get(k)) for k in keys]
+    missing = [k for k, e in pairs if not e]
+    rendered = [_cached_reference_html(k, e) for k, e in pairs if e]
+
+    # First entry follows the header line directly; later ones get a blank line
+    seps = itertools.chain(("\n",), itertools.repeat("\n\n"))
+    parts.extend(itertools.chain.from_iterable((sep, *frags) for sep, frags in zip(seps, rendered)))
 
     if missing:
-        lines.append("> **Note:** Missing BibTeX entries for keys: " + ", ".join(missing))
+        sep = "\n\n" if rendered else "\n"
+        parts.extend((sep, "> **Note:** Missing BibTeX entries for keys: ", ", ".join(missing)))
+
+    parts.extend(("\n\n", END_MARK, "\n"))
+    return "".join(parts)
 
-    content = "\n".join(lines).rstrip() + "\n"
-    return f"{BEGIN_MARK}\n{content}\n{END_MARK}\n"
+
+def _mask_generated_date(block: str) -> str:
+    return GENERATED_DATE_RE.sub("", block)
 
 
 def insert_or_replace_reference_block(md_text: str, new_block: str) -> str:
-    if BEGIN_MARK in md_text and END_MARK in md_text:
-        pattern = re.compile(
-            re.escape(BEGIN_MARK) + r".*?" + re.escape(END_MARK),
-            flags=re.DOTALL
-        )
-        return pattern.sub(new_block.strip(), md_text, count=1)
+    """
+    Return md_text with new_block inserted or swapped in. If the existing block
+    only differs by its generation date, md_text itself is returned (identity),
+    so callers can test `result is md_text`.
+    """
+    i = md_text.find(BEGIN_MARK)
+    j = md_text.find(END_MARK, i + len(BEGIN_MARK)) if i >= 0 else -1
+    if i >= 0 and j >= 0:
+        j += len(END_MARK)
+        new_block = new_block.strip()
+        if _mask_generated_date(md_text[i:j]) == _mask_generated_date(new_block):
+            return md_text
+        return md_text[:i] + new_block + md_text[j:]
+    elif BEGIN_MARK in md_text and END_MARK in md_text:
+        # END only appears before BEGIN: leave the note alone, as before
+        return md_text
     else:
         if not md_text.endswith("\n"):
             md_text += "\n"
@@ -240,43 +347,301 @@ def insert_or_replace_reference_block(md_text: str, new_block: str) -> str:
         return md_text + new_block
 
 
-def load_bib_map(bib_path: str) -> Dict[str, Dict[str, Any]]:
+def _library_to_bib_map(library) -> Dict[str, Dict[str, Any]]:
+    """
+    Flatten v2 Entry objects to the v1-style dict-of-dicts used below.
+    Like v1, field names and ENTRYTYPE are lowercased (AUTHOR -> author).
+    """
+    return {
+        e.key: {**{f.key.lower(): f.value for f in e.fields}, "ID": e.key, "ENTRYTYPE": e.entry_type.lower()}
+        for e in library.entries
+    }
+
+
+def _bib_disk_cache_path(bib_path: str) -> str:
+    """One pickle per bib file, so an edited bib overwrites its old entry."""
+    digest = hashlib.sha1(os.path.abspath(bib_path).encode("utf-8")).hexdigest()
+    return os.path.join(BIB_DISK_CACHE_DIR, f"{digest}.pkl")
+
+
+def _bib_disk_cache_stamp(bib_path: str) -> Tuple[int, int, int]:
+    """(format version, mtime_ns, size): a cached map is only valid for an equal stamp."""
+    st = os.stat(bib_path)
+    return BIB_DISK_CACHE_VERSION, st.st_mtime_ns, st.st_size
+
+
+def _read_bib_disk_cache(cache_path: str, stamp: Tuple[int, int, int]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return the cached bib map, or None; a stale or unreadable pickle counts as a miss."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+    except Exception:
+        return None
+    if cached_stamp != stamp or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _write_bib_disk_cache(cache_path: str, stamp: Tuple[int, int, int],
+                          bib_map: Dict[str, Dict[str, Any]]) -> None:
+    """Write atomically (tmp + rename); a failing cache must never break the run."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, bib_map), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_bib_map(bib_path: str, persist: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse bib_path (memoized in-process and on disk). With persist=False, e.g.
+    for --dry-run, an existing on-disk cache is still read but never written.
+    """
     if bib_path in _BIB_CACHE:
         return _BIB_CACHE[bib_path]
+
+    cache_path = _bib_disk_cache_path(bib_path)
+    stamp = _bib_disk_cache_stamp(bib_path)
+    bib_map = _read_bib_disk_cache(cache_path, stamp)
+    if bib_map is not None:
+        _BIB_CACHE[bib_path] = bib_map
+        return bib_map
+
     with open(bib_path, "r", encoding="utf-8") as f:
-        db = bibtexparser.load(f)
-    bib_map = {e.get("ID", ""): e for e in db.entries}
+        text = f.read()
+    bib_map = _library_to_bib_map(bibtexparser.parse_string(text))
+    if persist:
+        _write_bib_disk_cache(cache_path, stamp, bib_map)
     _BIB_CACHE[bib_path] = bib_map
     return bib_map
 
 
-def extract_frontmatter(md_text: str) -> Tuple[Dict[str, Any], str]:
+def load_bib_subset(bib_path: str, keys: Iterable[str], persist: bool = True) -> Dict[str, Dict[str, Any]]:
     """
-    Return (yaml_dict, body_text). If no frontmatter, ({}, md_text).
+    Return load_bib_map(bib_path) restricted to the given citekeys; this is what
+    gets shipped to workers, so they do not each receive the whole .bib file.
+    """
+    wanted = frozenset(k for k in keys if k)
+    cache_key = (bib_path, wanted)
+    if cache_key in _BIB_SUBSET_CACHE:
+        return _BIB_SUBSET_CACHE[cache_key]
+
+    full = load_bib_map(bib_path, persist=persist)
+    subset = {k: full[k] for k in wanted if k in full}
+    _BIB_SUBSET_CACHE[cache_key] = subset
+    return subset
+
+
+def _init_prebuilt_bib_maps(bib_maps: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    """ProcessPoolExecutor initializer: install the bib maps built by main()."""
+    _PREBUILT_BIB_MAPS.clear()
+    _PREBUILT_BIB_MAPS.update(bib_maps)
+
+
+def get_prebuilt_bib_map(bib_path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    return _PREBUILT_BIB_MAPS.get(bib_path)
+
+
+def prebuild_bib_maps(md_paths, base_folder: str, persist: bool = True) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Read only the frontmatter of every note, union the citekeys per bibfile,
+    and return each bibfile's map restricted to that union. The full parse
+    behind it is persisted by load_bib_map, so later runs skip it.
+    """
+    wanted: Dict[str, set] = {}
+    for p in md_paths:
+        front = _read_frontmatter_only(p)[0]
+        bibfile = front.get("bibfile")
+        keys = front.get("citekeys", [])
+        if not bibfile or not keys:
+            continue
+        bib_path = resolve_bib_path(bibfile, base_folder)
+        if os.path.exists(bib_path):
+            wanted.setdefault(bib_path, set()).update(keys)
+    return {bib_path: load_bib_subset(bib_path, keys, persist=persist) for bib_path, keys in wanted.items()}
+
+
+def _fast_scalar(value: str) -> Tuple[bool, Any]:
+    """
+    Return (ok, value) for a plain or simply-quoted YAML scalar; ok=False means
+    'ask YAML' (anything that might be invalid or need YAML's own rules).
+    """
+    if not value or value in ("~", "null", "Null", "NULL"):
+        return True, None
+    if value[0] in "'\"":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != value[0] or value[0] in inner or "\\" in inner:
+            return False, None
+        return True, inner
+    if (value[0] in FAST_PLAIN_BAD_START or value.endswith(":")
+            or ": " in value or ":\t" in value or " #" in value or "\t#" in value):
+        return False, None
+    return True, value
+
+
+def _fast_block_list(lines: List[str], i: int) -> Tuple[Optional[List[Any]], int, bool]:
+    """
+    Read the block under an empty 'key:' starting at lines[i]. Return
+    (items_or_None, next_index, ok). Only a flat '- scalar' list with one
+    consistent, space-only indent is accepted; anything else is not ok.
+    """
+    items: List[Any] = []
+    indent = None
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            i += 1
+            continue
+        if line[0] not in " \t-":
+            break  # next top-level key
+        body = line.lstrip(" ")
+        if body.startswith("\t"):
+            return None, i, False
+        item_indent = len(line) - len(body)
+        if indent is None:
+            indent = item_indent
+        if item_indent != indent or not (body == "-" or body.startswith("- ")):
+            return None, i, False
+        ok, v = _fast_scalar(body[1:].strip())
+        if not ok:
+            return None, i, False
+        items.append(v)
+        i += 1
+    return (items or None), i, True
+
+
+def _fast_frontmatter(yaml_block: str) -> Optional[Dict[str, Any]]:
+    """
+    Line-based reader for the top-level keys process_file needs (bibfile,
+    citekeys, date). Every top-level line must be a plain 'key: scalar' or an
+    empty 'key:' followed by a flat '- scalar' list; on anything else (quoted
+    keys, nested mappings, continuation lines, tabs, aliases, flow style,
+    possibly-invalid YAML) it returns None so the caller can use YAML.
+    Dates stay strings, which _date_prefix_from_frontmatter accepts.
+    """
+    out: Dict[str, Any] = {}
+    lines = [line.rstrip("\r") for line in yaml_block.split("\n")]
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            i += 1
+            continue
+        m = FAST_KEY_LINE_RE.match(line)
+        if not m:
+            return None
+        key, value = m.group(1), (m.group(2) or "").strip()
+        i += 1
+        if value:
+            ok, v = _fast_scalar(value)
+            # A following indented line would be a continuation or nested block
+            j = i
+            while j < n and (not lines[j].strip() or lines[j].strip().startswith("#")):
+                j += 1
+            if not ok or (j < n and lines[j][0] in " \t"):
+                return None
+        else:
+            v, i, ok = _fast_block_list(lines, i)
+            if not ok:
+                return None
+        if key not in FAST_FRONTMATTER_KEYS:
+            continue
+        if key == "date":
+            # YAML resolves some date forms (e.g. '2025-9-21 10:00:00') itself
+            if v is not None and (not isinstance(v, str) or not _DATE_RE.match(v)):
+                return None
+        else:
+            for item in (v if isinstance(v, list) else [v]):
+                # Might resolve to a bool/number; quoted or not, let YAML decide
+                if isinstance(item, str) and FAST_NON_STR_RE.match(item):
+                    return None
+        out[key] = v
+    return out
+
+
+def extract_frontmatter(md_text: str, shallow: bool = False) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Return (yaml_dict, body_text, raw_yaml_block). If no frontmatter, ({}, md_text, "").
+    The raw block is everything between the two '---' delimiters, verbatim.
+    With shallow=True, only FAST_FRONTMATTER_KEYS are guaranteed to be present;
+    plain frontmatter is then read without YAML at all.
     """
     if not md_text.startswith("---"):
-        return {}, md_text
+        return {}, md_text, ""
     parts = md_text.split("---", 2)
     if len(parts) < 3:
-        return {}, md_text
+        return {}, md_text, ""
     yaml_block, body = parts[1], parts[2]
+    if shallow:
+        data = _fast_frontmatter(yaml_block)
+        if data is not None:
+            return data, body, yaml_block
     try:
-        data = yaml.safe_load(yaml_block) or {}
+        data = yaml.load(yaml_block, Loader=Loader) or {}
         if not isinstance(data, dict):
             data = {}
-        return data, body
+        return data, body, yaml_block
     except yaml.YAMLError:
-        return {}, md_text
+        return {}, md_text, ""
+
+
+def _read_frontmatter_only(path: str) -> Tuple[Dict[str, Any], str, Optional[int]]:
+    """
+    Read just enough of path to parse its frontmatter.
+    Return (yaml_dict, head, resume_at): head is the text consumed so far and
+    resume_at the f.tell() position right after it, or None if head is
+    already the whole file. _read_rest(path, head, resume_at) completes it.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(FRONTMATTER_READ_CHUNK)
+        if len(head) < FRONTMATTER_READ_CHUNK:
+            return (extract_frontmatter(head, shallow=True)[0] if head.startswith("---") else {}), head, None
+        if not head.startswith("---"):
+            return {}, head, f.tell()
+        while head.find("---", 3) < 0 and len(head) < FRONTMATTER_MAX_CHARS:
+            chunk = f.read(FRONTMATTER_READ_CHUNK)
+            if not chunk:
+                return extract_frontmatter(head, shallow=True)[0], head, None
+            head += chunk
+        if head.find("---", 3) < 0:
+            # Unusually long header: fall back to the full file
+            head += f.read()
+            return extract_frontmatter(head, shallow=True)[0], head, None
+        resume_at = f.tell()
+    return extract_frontmatter(head, shallow=True)[0], head, resume_at
+
+
+def _read_rest(path: str, head: str, resume_at: Optional[int]) -> str:
+    """Return the full text of path given what _read_frontmatter_only consumed."""
+    if resume_at is None:
+        return head
+    with open(path, "r", encoding="utf-8") as f:
+        f.seek(resume_at)
+        return head + f.read()
 
 
 def render_with_frontmatter(front: Dict[str, Any], body: str) -> str:
-    yml = yaml.safe_dump(front, sort_keys=False, allow_unicode=True).strip()
+    """
+    Re-serialize front as YAML. Not used when the frontmatter is unchanged;
+    process_file writes the original block back verbatim instead.
+    """
+    yml = yaml.dump(front, Dumper=Dumper, sort_keys=False, allow_unicode=True).strip()
     return f"---\n{yml}\n---{body if body.startswith('\n') else '\n' + body}"
 
 
-def compute_target_path(path: str, front_date) -> Optional[str]:
+def compute_target_path(path: str, fm_prefix: str) -> Optional[str]:
     """
-    Compute new filename <YYYY-MM-DD>-<slug><ext> from frontmatter date.
+    Compute new filename <YYYY-MM-DD>-<slug><ext> from the frontmatter date
+    prefix fm_prefix ('YYYY-MM-DD-' or '').
     slug = current filename without any leading date prefix.
     Return full new path, or None if date can't be parsed or name already matches.
     """
@@ -285,23 +650,47 @@ def compute_target_path(path: str, front_date) -> Optional[str]:
     root, ext = os.path.splitext(fname)
 
     # Strip any leading date-like prefix to get slug
-    slug = re.sub(r"^\d{4}-\d{2}-\d{2}-", "", root)
+    slug = _DATE_PREFIX_RE.sub("", root)
 
-    prefix = _date_prefix_from_frontmatter(front_date)  # 'YYYY-MM-DD-' or ''
-    if not prefix:
+    if not fm_prefix:
         return None  # can't rename without a valid date
 
-    new_name = f"{prefix}{slug}{ext}"
+    new_name = f"{fm_prefix}{slug}{ext}"
     if fname == new_name:
         return None
     return os.path.join(folder, new_name)
 
 
-def process_file(path: str, inline_style: bool = True, dry_run: bool = False, base_folder: str = "."):
-    with open(path, "r", encoding="utf-8") as f:
-        original = f.read()
+def rename_no_clobber(src: str, dst: str) -> bool:
+    """
+    Rename src to dst unless dst exists; return False if it does. Unlike an
+    exists() check followed by os.rename, this is safe when several workers
+    race for the same target: the claim on dst is atomic.
+    """
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except FileExistsError:
+        return False
+    except (OSError, NotImplementedError):
+        # No hard links here: claim dst with an exclusive create, then replace it
+        try:
+            fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        os.replace(src, dst)
+        return True
+    os.unlink(src)
+    return True
+
+
+def resolve_bib_path(bibfile: str, base_folder: str) -> str:
+    return os.path.join(base_folder, bibfile) if not os.path.isabs(bibfile) else bibfile
 
-    front, body = extract_frontmatter(original)
+
+def process_file(path: str, inline_style: bool = True, dry_run: bool = False, base_folder: str = "."):
+    # Cheaply reject notes without references before reading the whole file
+    front, head, resume_at = _read_frontmatter_only(path)
 
     bibfile = front.get("bibfile")
     keys = front.get("citekeys", [])
@@ -310,45 +699,63 @@ def process_file(path: str, inline_style: bool = True, dry_run: bool = False, ba
     if not bibfile or not keys:
         return False, "No bibfile or citekeys in frontmatter."
 
-    bib_path = os.path.join(base_folder, bibfile) if not os.path.isabs(bibfile) else bibfile
+    bib_path = resolve_bib_path(bibfile, base_folder)
     if not os.path.exists(bib_path):
         return False, f"Bib file not found: {bibfile}"
 
-    bib_map = load_bib_map(bib_path)
+    # Only now read the remainder; front is reused, so nothing is re-parsed.
+    # A non-empty front means original is '---<raw_yaml_block>---<body>'.
+    original = _read_rest(path, head, resume_at)
+    _, raw_yaml_block, body = original.split("---", 2)
+
+    bib_map = get_prebuilt_bib_map(bib_path)
+    if bib_map is None:
+        bib_map = load_bib_subset(bib_path, keys, persist=not dry_run)
 
     block = generate_reference_block(keys, bib_map, add_style=inline_style)
 
     # Insert/replace references in BODY (not in frontmatter)
     updated_body = insert_or_replace_reference_block(body, block)
 
-    # Recompose the full document
-    updated = render_with_frontmatter(front, updated_body)
+    # Recompose the full document; frontmatter is never modified, so keep it verbatim
+    if updated_body is body:
+        updated = original
+    else:
+        updated = f"---{raw_yaml_block}---{updated_body}"
 
     # Determine target rename (based on header date)
-    target = compute_target_path(path, front_date)
+    fm_prefix = _date_prefix_from_frontmatter(front_date)
+    target = compute_target_path(path, fm_prefix)
+
+    # Identity covers the usual case; == (length check + memcmp) catches an
+    # equal string built from scratch without encoding or hashing anything
+    content_changed = updated is not original and updated != original
+
+    if not content_changed and not target:
+        return False, "No changes."
 
     if dry_run:
         rename_msg = f", would rename to {os.path.basename(target)}" if target else ""
-        if updated != original or target:
-            return True, f"Would update (dry run){rename_msg}."
-        else:
-            return False, "No changes."
+        return True, f"Would update (dry run){rename_msg}."
 
-    # Make a backup once
-    backup = make_backup(path, front_date=front_date)
+    if content_changed:
+        # Make a backup once
+        backup = make_backup(path, fm_prefix)
 
-    # Write updated content to current file
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(updated)
+        # Write updated content to current file
+        write_text_atomic(path, updated)
+        msg = f"Updated. Backup: {os.path.basename(backup)}"
+    else:
+        msg = "Content unchanged"
 
     # Rename if needed
     if target:
-        if os.path.exists(target):
-            return True, f"Updated. Backup: {os.path.basename(backup)}. Rename skipped (target exists): {os.path.basename(target)}"
-        os.rename(path, target)
-        return True, f"Updated. Backup: {os.path.basename(backup)}. Renamed to: {os.path.basename(target)}"
+        if not rename_no_clobber(path, target):
+            # Nothing was written or renamed if the content was already current
+            return content_changed, f"{msg}. Rename skipped (target exists): {os.path.basename(target)}"
+        return True, f"{msg}. Renamed to: {os.path.basename(target)}"
 
-    return True, f"Updated. Backup: {os.path.basename(backup)}"
+    return True, msg
 
 
 def main():
@@ -362,26 +769,48 @@ def main():
     ap.add_argument("--dry-run", action="store_true", help="Show planned changes without writing files.")
     args = ap.parse_args()
 
-    md_paths = sorted(
-        [p for ext in ("*.md", "*.markdown") for p in glob.glob(os.path.join(args.folder, ext))]
-    )
+    # Single directory pass; like glob, skip hidden files
+    with os.scandir(args.folder) as it:
+        md_paths = sorted(
+            os.path.join(args.folder, e.name) for e in it
+            if e.name.endswith((".md", ".markdown")) and not e.name.startswith(".") and e.is_file()
+        )
     if not md_paths:
         print("No Markdown files found.")
         return
 
+    worker = functools.partial(
+        process_file,
+        inline_style=args.style_inline,
+        dry_run=args.dry_run,
+        base_folder=args.folder
+    )
+
+    # Parse each referenced bibfile once, up front, for all notes citing it
+    bib_maps = prebuild_bib_maps(md_paths, args.folder, persist=not args.dry_run)
+
     changed = 0
-    for p in md_paths:
-        updated, msg = process_file(
-            p,
-            inline_style=args.style_inline,
-            dry_run=args.dry_run,
-            base_folder=args.folder
-        )
-        rel = os.path.relpath(p, args.folder)
-        prefix = "[CHANGED]" if updated else "[SKIP]"
-        print(f"{prefix} {rel}: {msg}")
-        if updated and not args.dry_run:
-            changed += 1
+    with contextlib.ExitStack() as stack:
+        if len(md_paths) < PARALLEL_MIN_FILES:
+            _init_prebuilt_bib_maps(bib_maps)
+            results = (worker(p) for p in md_paths)
+        else:
+            # Notes are independent; workers receive the prebuilt maps at start-up
+            ex = stack.enter_context(ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(md_paths)),
+                initializer=_init_prebuilt_bib_maps,
+                initargs=(bib_maps,)
+            ))
+            results = ex.map(worker, md_paths)
+
+        # Report each note as its result arrives, so a later failure
+        # does not hide the notes that were already written
+        for p, (updated, msg) in zip(md_paths, results):
+            rel = os.path.relpath(p, args.folder)
+            prefix = "[CHANGED]" if updated else "[SKIP]"
+            print(f"{prefix} {rel}: {msg}")
+            if updated and not args.dry_run:
+                changed += 1
 
     if not args.dry_run:
         print(f"\nDone. Files updated: {changed}/{len(md_paths)}")
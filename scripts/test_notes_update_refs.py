@@ -0,0 +1,101 @@
+"""
+Checks for the YAML-free frontmatter reader in notes_update_refs.py.
+
+Run with:  python -m pytest scripts/test_notes_update_refs.py
+"""
+
+import os
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import notes_update_refs as nur  # noqa: E402
+
+
+def _yaml_view(block):
+    """What process_file sees from the YAML path, or None if YAML rejects the block."""
+    try:
+        data = yaml.safe_load(block) or {}
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict):
+        return {}
+    return {
+        "bibfile": data.get("bibfile"),
+        "citekeys": data.get("citekeys"),
+        "prefix": nur._date_prefix_from_frontmatter(data.get("date")),
+    }
+
+
+def _fast_view(data):
+    return {
+        "bibfile": data.get("bibfile"),
+        "citekeys": data.get("citekeys"),
+        "prefix": nur._date_prefix_from_frontmatter(data.get("date")),
+    }
+
+
+# Frontmatter YAML rejects: the fast reader must not accept any of these
+INVALID_BLOCKS = [
+    "\ntitle: *x\nbibfile: r.bib\ncitekeys:\n  - a\n",
+    "\nbibfile:r.bib\ncitekeys:\n  - a\n",
+    "\nbibfile: r.bib\ncitekeys:\n  - a\n- b\n",
+    "\nbibfile: r.bib\ncitekeys:\n\t- a\n\t- b\n",
+    "\ntitle: Foo: bar\nbibfile: r.bib\ncitekeys:\n  - a\n",
+]
+
+# Valid YAML the fast reader must either match exactly or hand back to YAML
+VALID_BLOCKS = [
+    "\ntitle: 'Source inference'\ndate: 2025-09-28\nbibfile: \"reference.bib\"\n"
+    "citekeys:\n    - alapati2000\n    - brandt2007\n",
+    "\nbibfile: r.bib\ncitekeys:\n- a\n- 'b'\ndate: 2025-01-02\ntags:\n  - x\n",
+    "\n\"bibfile\": r.bib\ncitekeys:\n  - a\n",
+    "\nbibfile: r.bib\ndate: 2025-9-21 10:00:00\ncitekeys:\n  - a\n",
+    "\nbibfile: r.bib\ncitekeys:\n  - a\n    - b\n",
+    "\nbibfile: r.bib\ncitekeys: [a, b]\n",
+    "\nbibfile: r.bib # comment\ncitekeys:\n  - a\n",
+    "\nbibfile: &x r.bib\ncitekeys:\n  - a\n",
+    "\nheader:\n  teaser: x.jpg\nbibfile: r.bib\ncitekeys:\n  - a\n",
+    "\ntitle: a\n  continued\nbibfile: r.bib\n",
+    "\nbibfile: r.bib\ncitekeys:\n  - 2000\n  - yes\n",
+    "\nbibfile: r.bib\ncitekeys:\n  # a comment\n  - a\n\n  - b\ndate: '2025-09-28'\n",
+    "\ntitle: plain\r\nbibfile: r.bib\r\ncitekeys:\r\n  - a\r\n",
+    "\ntitle: no references here\n",
+    "\n- a\n- b\n",
+    "",
+]
+
+
+@pytest.mark.parametrize("block", INVALID_BLOCKS)
+def test_fast_frontmatter_rejects_invalid_yaml(block):
+    assert _yaml_view(block) is None
+    assert nur._fast_frontmatter(block) is None
+
+
+@pytest.mark.parametrize("block", VALID_BLOCKS)
+def test_fast_frontmatter_matches_yaml(block):
+    expected = _yaml_view(block)
+    assert expected is not None
+    fast = nur._fast_frontmatter(block)
+    if fast is not None:
+        assert _fast_view(fast) == expected
+
+
+@pytest.mark.parametrize("block", [
+    "\n\"bibfile\": r.bib\ncitekeys:\n  - a\n",
+    "\nbibfile: r.bib\ndate: 2025-9-21 10:00:00\ncitekeys:\n  - a\n",
+    "\nbibfile: r.bib\ncitekeys:\n  - a\n    - b\n",
+])
+def test_fast_frontmatter_falls_back_on_divergent_shapes(block):
+    assert nur._fast_frontmatter(block) is None
+
+
+def test_extract_frontmatter_shallow_skips_invalid_yaml():
+    md = "---\ntitle: *x\nbibfile: r.bib\ncitekeys:\n  - a\n---\nbody\n"
+    front, body, raw = nur.extract_frontmatter(md, shallow=True)
+    assert front == {}
+    assert body == md
+    assert raw == ""